@@ -54,7 +54,7 @@ else:
     environ['OPENBLAS_NUM_THREADS'] = '1'
 
 # this loads numpy, so we have to defer loading until OpenBLAS check is done
-from traits.api import Bool, Either, HasStrictTraits, Property, Str, Trait, cached_property
+from traits.api import Bool, Either, HasStrictTraits, Int, Property, Str, Trait, cached_property
 
 
 class Config(HasStrictTraits):
@@ -99,6 +99,17 @@ class Config(HasStrictTraits):
 
     _h5library = Either('pytables', 'tables', 'h5py', default='pytables')
 
+    #: Size of the raw data chunk cache in bytes for each cache file opened with h5py.
+    #: Defaults to None, which keeps the h5py default of 1 MiB. A larger chunk cache
+    #: avoids repeated reading and decompressing of chunks when large cached arrays
+    #: are accessed frequently. Only affects cache files opened afterwards.
+    h5_rdcc_nbytes = Either(None, Int)
+
+    #: Number of chunk slots in the raw data chunk cache for each cache file opened with h5py.
+    #: Defaults to None, which keeps the h5py default. Should be a prime number about
+    #: 100 times the number of chunks that fit into :attr:`h5_rdcc_nbytes`.
+    h5_rdcc_nslots = Either(None, Int)
+
     #: Defines the path to the directory containing Acoulars cache files.
     #: If the specified :attr:`cache_dir` directory does not exist,
     #: it will be created. :attr:`cache_dir` defaults to current session path.
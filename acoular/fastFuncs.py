@@ -27,7 +27,7 @@ def calcCSM(csm, SpecAllMics):
     """Adds a given spectrum to the Cross-Spectral-Matrix (CSM).
     Here only the upper triangular matrix of the CSM is calculated. After
     averaging over the various ensembles, the whole CSM is created via complex
-    conjugation transposing. This happens outside
+    conjugation transposing (see :func:`completeCSM`). This happens outside
     (in :class:`PowerSpectra<acoular.spectra.PowerSpectra>`).
     This method was called 'faverage' in acoular versions <= 16.5.
 
@@ -53,6 +53,80 @@ def calcCSM(csm, SpecAllMics):
     return csm
 
 
+@nb.njit(
+    [
+        nb.complex128[:, :, ::1](nb.complex128[:, :, ::1], nb.complex128[:, :, ::1]),
+        nb.complex64[:, :, ::1](nb.complex64[:, :, ::1], nb.complex64[:, :, ::1]),
+    ],
+    cache=cachedOption,
+    parallel=True,
+    fastmath=fastOption,
+)
+def calcCSMBatch(csm, SpecBatch):
+    """Adds a batch of spectra to the Cross-Spectral-Matrix (CSM).
+    Does the same as calling :func:`calcCSM` for every spectrum of the batch,
+    but all spectra are added within one parallel loop over the frequencies.
+    This avoids the overhead of starting the threads for every single ensemble
+    and keeps each frequency slice of the CSM in cache while it is updated.
+
+    Parameters
+    ----------
+    csm : complex128[nFreqs, nMics, nMics]
+        The cross spectral matrix which gets updated with the spectra of the ensembles.
+    SpecBatch : complex128[nBlocks, nFreqs, nMics]
+        Spectra of the added ensembles at all Mics.
+
+    Returns
+    -------
+    None : as the input csm gets overwritten.
+
+    """
+    nBlocks = SpecBatch.shape[0]
+    nFreqs = csm.shape[0]
+    nMics = csm.shape[1]
+    for cntFreq in nb.prange(nFreqs):
+        for cntBlock in range(nBlocks):
+            for cntColumn in range(nMics):
+                temp = SpecBatch[cntBlock, cntFreq, cntColumn].conjugate()
+                for cntRow in range(cntColumn + 1):  # calculate upper triangular matrix (of every frequency-slice) only
+                    csm[cntFreq, cntRow, cntColumn] += temp * SpecBatch[cntBlock, cntFreq, cntRow]
+    return csm
+
+
+@nb.njit(
+    [
+        nb.complex128[:, :, ::1](nb.complex128[:, :, ::1]),
+        nb.complex64[:, :, ::1](nb.complex64[:, :, ::1]),
+    ],
+    cache=cachedOption,
+    parallel=True,
+    fastmath=fastOption,
+)
+def completeCSM(csm):
+    """Creates the full Cross-Spectral-Matrix (CSM) from its upper triangular part.
+    The strictly lower triangular part of the CSM (as left by :func:`calcCSM`) is
+    overwritten with the complex conjugate of the upper triangular part. This is
+    done in-place, so that no transposed copy of the whole CSM is needed.
+
+    Parameters
+    ----------
+    csm : complex128[nFreqs, nMics, nMics]
+        The cross spectral matrix whose upper triangular part is already calculated.
+
+    Returns
+    -------
+    None : as the input csm gets overwritten.
+
+    """
+    nFreqs = csm.shape[0]
+    nMics = csm.shape[1]
+    for cntFreq in nb.prange(nFreqs):
+        for cntColumn in range(nMics):
+            for cntRow in range(cntColumn):
+                csm[cntFreq, cntColumn, cntRow] = csm[cntFreq, cntRow, cntColumn].conjugate()
+    return csm
+
+
 def beamformerFreq(steerVecType, boolRemovedDiagOfCSM, normFactor, inputTupleSteer, inputTupleCsm):
     r"""Conventional beamformer in frequency domain. Use either a predefined
     steering vector formulation (see Sarradj 2012) or pass your own
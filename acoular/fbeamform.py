@@ -63,6 +63,7 @@ from numpy import (
     ndarray,
     newaxis,
     ones,
+    outer,
     pi,
     real,
     reshape,
@@ -398,6 +399,9 @@ class BeamformerBase(HasPrivateTraits):
         depends_on=['digest', 'freq_data.ind_low', 'freq_data.ind_high'],
     )
 
+    # name of the result node in the cache file, for internal use
+    _nodename = Property(depends_on=['digest'])
+
     @cached_property
     def _get_digest(self):
         return digest(self)
@@ -406,6 +410,10 @@ class BeamformerBase(HasPrivateTraits):
     def _get_ext_digest(self):
         return digest(self, 'ext_digest')
 
+    @cached_property
+    def _get__nodename(self):
+        return self.__class__.__name__ + self.digest
+
     def _get_filecache(self):
         """Function collects cached results from file depending on
         global/local caching behaviour. Returns (None, None) if no cachefile/data
@@ -417,13 +425,15 @@ class BeamformerBase(HasPrivateTraits):
             #            print("no cachefile:", self.freq_data.basename)
             return (None, None, None)  # only happens in case of global caching readonly
 
-        nodename = self.__class__.__name__ + self.digest
+        nodename = self._nodename
         #        print("collect filecache for nodename:",nodename)
-        if config.global_caching == 'overwrite' and self.h5f.is_cached(nodename):
+        is_cached = self.h5f.is_cached(nodename)
+        if config.global_caching == 'overwrite' and is_cached:
             #            print("remove existing data for nodename",nodename)
             self.h5f.remove_data(nodename)  # remove old data before writing in overwrite mode
+            is_cached = False
 
-        if not self.h5f.is_cached(nodename):
+        if not is_cached:
             #            print("no data existent for nodename:", nodename)
             if config.global_caching == 'readonly':
                 return (None, None, None)
@@ -435,20 +445,28 @@ class BeamformerBase(HasPrivateTraits):
                 'int8',  #'bool',
                 group,
             )
-            if isinstance(self, BeamformerAdaptiveGrid):
-                self.h5f.create_compressible_array('gpos', (3, self.size), 'float64', group)
-                self.h5f.create_compressible_array('result', (numfreq, self.size), self.precision, group)
-            else:
-                self.h5f.create_compressible_array('result', (numfreq, self.steer.grid.size), self.precision, group)
+            self._create_filecache_arrays(numfreq, group)
 
         ac = self.h5f.get_data_by_reference('result', '/' + nodename)
         fr = self.h5f.get_data_by_reference('freqs', '/' + nodename)
-        if isinstance(self, BeamformerAdaptiveGrid):
-            gpos = self.h5f.get_data_by_reference('gpos', '/' + nodename)
-        else:
-            gpos = None
+        gpos = self._get_filecache_gpos(nodename)
         return (ac, fr, gpos)
 
+    def _create_filecache_arrays(self, numfreq, group):
+        """Creates the result array in the cache file group."""
+        self.h5f.create_compressible_array('result', (numfreq, self.steer.grid.size), self.precision, group)
+
+    def _get_filecache_gpos(self, nodename):
+        """Returns the cached grid positions, only needed for beamformers without predefined grid."""
+
+    def _init_result(self, numfreq):
+        """Returns the initialized result array if the result is not cached."""
+        return zeros((numfreq, self.steer.grid.size), dtype=self.precision)
+
+    def _reshape_result(self, h):
+        """Reshapes the result at a single frequency (band) to the shape of the grid."""
+        return h.reshape(self.steer.grid.shape)
+
     def _assert_equal_channels(self):
         numchannels = self.freq_data.numchannels
         if numchannels != self.steer.mics.num_mics or numchannels == 0:
@@ -485,11 +503,7 @@ class BeamformerBase(HasPrivateTraits):
             #                        print("cached results are complete! return.")
             else:
                 #                print("no caching or not activated, calculate result")
-                if isinstance(self, BeamformerAdaptiveGrid):
-                    self._gpos = zeros((3, self.size), dtype=self.precision)
-                    ac = zeros((numfreq, self.size), dtype=self.precision)
-                else:
-                    ac = zeros((numfreq, self.steer.grid.size), dtype=self.precision)
+                ac = self._init_result(numfreq)
                 fr = zeros(numfreq, dtype='int8')
                 self.calc(ac, fr)
         return ac
@@ -667,9 +681,7 @@ class BeamformerBase(HasPrivateTraits):
                         Warning,
                         stacklevel=2,
                     )
-        if isinstance(self, BeamformerAdaptiveGrid):
-            return h
-        return h.reshape(self.steer.grid.shape)
+        return self._reshape_result(h)
 
     def integrate(self, sector):
         """Integrates result map over a given sector.
@@ -1134,11 +1146,13 @@ class PointSpreadFunction(HasPrivateTraits):
             #            print("no cachefile:", filename)
             return (None, None)  # only happens in case of global caching readonly
 
-        if config.global_caching == 'overwrite' and self.h5f.is_cached(nodename):
+        is_cached = self.h5f.is_cached(nodename)
+        if config.global_caching == 'overwrite' and is_cached:
             #            print("remove existing data for nodename",nodename)
             self.h5f.remove_data(nodename)  # remove old data before writing in overwrite mode
+            is_cached = False
 
-        if not self.h5f.is_cached(nodename):
+        if not is_cached:
             #            print("no data existent for nodename:", nodename)
             if config.global_caching == 'readonly':
                 return (None, None)
@@ -1637,7 +1651,9 @@ class BeamformerCleansc(BeamformerBase):
                         H = hh.conj() * hh
                         hh = (D1 + H * wmax) / sqrt(1 + dot(ww, H))
                     hh = hh[:, newaxis]
-                    csm1 = hmax * (hh * hh.conj().T)
+                    # transposed coherent CSM hmax * conj(hh) * hh^T, scaled in place
+                    csm1 = outer(hh.conj(), hh)
+                    csm1 *= self.damp * hmax
 
                     # h1 = self.steer._beamformerCall(f[i], self.r_diag, normFactor, (array((hmax, ))[newaxis, :], hh[newaxis, :].conjugate()))[0]
                     h1 = beamformerFreq(
@@ -1648,7 +1664,7 @@ class BeamformerCleansc(BeamformerBase):
                         (array((hmax,)), hh.conj()),
                     )[0]
                     h -= self.damp * h1
-                    csm -= self.damp * csm1.T  # transpose(0,2,1)
+                    csm -= csm1
                 ac[i] = result
                 fr[i] = 1
 
@@ -2035,15 +2051,17 @@ class BeamformerSODIX(BeamformerBase):
         """
         H5cache.get_cache_file(self, self.freq_data.basename)
         if not self.h5f:
-            return (None, None)  # only happens in case of global caching readonly
+            return (None, None, None)  # only happens in case of global caching readonly
 
-        nodename = self.__class__.__name__ + self.digest
-        if config.global_caching == 'overwrite' and self.h5f.is_cached(nodename):
+        nodename = self._nodename
+        is_cached = self.h5f.is_cached(nodename)
+        if config.global_caching == 'overwrite' and is_cached:
             self.h5f.remove_data(nodename)  # remove old data before writing in overwrite mode
+            is_cached = False
 
-        if not self.h5f.is_cached(nodename):
+        if not is_cached:
             if config.global_caching == 'readonly':
-                return (None, None)
+                return (None, None, None)
             #                print("initialize data.")
             numfreq = self.freq_data.fftfreq().shape[0]  # block_size/2 + 1steer_obj
             group = self.h5f.create_new_group(nodename)
@@ -2545,6 +2563,24 @@ class BeamformerAdaptiveGrid(BeamformerBase, Grid):
     def _get_gpos(self):
         return self._gpos
 
+    def _create_filecache_arrays(self, numfreq, group):
+        """Creates the result and grid position arrays in the cache file group."""
+        self.h5f.create_compressible_array('gpos', (3, self.size), 'float64', group)
+        self.h5f.create_compressible_array('result', (numfreq, self.size), self.precision, group)
+
+    def _get_filecache_gpos(self, nodename):
+        """Returns the cached grid positions."""
+        return self.h5f.get_data_by_reference('gpos', '/' + nodename)
+
+    def _init_result(self, numfreq):
+        """Returns the initialized result array if the result is not cached."""
+        self._gpos = zeros((3, self.size), dtype=self.precision)
+        return zeros((numfreq, self.size), dtype=self.precision)
+
+    def _reshape_result(self, h):
+        """Returns the result at a single frequency (band), there is no grid shape."""
+        return h
+
     def integrate(self, sector):
         """Integrates result map over a given sector.
 
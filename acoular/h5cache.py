@@ -3,15 +3,19 @@
 # ------------------------------------------------------------------------------
 
 # imports from other packages
-import gc
-from os import listdir, path
-from weakref import WeakValueDictionary
+import logging
+from collections import defaultdict, deque
+from os import path
+from threading import Lock, RLock
+from weakref import WeakKeyDictionary, WeakValueDictionary, finalize, ref
 
-from traits.api import Bool, Delegate, Dict, HasPrivateTraits, Instance
+from traits.api import Delegate, Dict, HasPrivateTraits, Instance
 
 from .configuration import Config, config
 from .h5files import _get_cachefile_class
 
+logger = logging.getLogger(__name__)
+
 
 class H5cache_class(HasPrivateTraits):
     """Cache class that handles opening and closing 'tables.File' objects."""
@@ -20,23 +24,33 @@ class H5cache_class(HasPrivateTraits):
 
     cache_dir = Delegate('config')
 
-    busy = Bool(False)
-
     open_files = WeakValueDictionary()
 
     openFileReferenceCount = Dict()
 
-    def _idle_if_busy(self):
-        while self.busy:
-            pass
+    def __init__(self, **traits):
+        super().__init__(**traits)
+        # serializes the bookkeeping of concurrent threads, waiting threads sleep instead of spinning
+        self._lock = RLock()
+        # per-file locks, so that only threads opening the same file wait for each other
+        self._file_locks = defaultdict(Lock)
+        # finalizers that release the file reference of an object once it is garbage collected
+        self._finalizers = WeakKeyDictionary()
+        # file references released by finalizers, which may run in any thread at any time;
+        # they only queue the release, which is applied later while holding the lock
+        self._released = deque()
 
     def open_cachefile(self, cacheFileName, mode):
         File = _get_cachefile_class()
         return File(path.join(self.cache_dir, cacheFileName), mode)
 
     def close_cachefile(self, cachefile):
-        self.openFileReferenceCount.pop(get_basename(cachefile))
-        cachefile.close()
+        with self._lock:
+            cacheFileName = get_basename(cachefile)
+            self.openFileReferenceCount.pop(cacheFileName, None)
+            if self.open_files.get(cacheFileName) is cachefile:
+                del self.open_files[cacheFileName]
+            cachefile.close()
 
     def get_filename(self, file):
         File = _get_cachefile_class()
@@ -51,73 +65,96 @@ class H5cache_class(HasPrivateTraits):
             return iter(self.open_files.values())
 
     def close_unreferenced_cachefiles(self):
-        for openCacheFile in self.get_open_cachefiles():
-            if not self.is_reference_existent(openCacheFile):
-                #                print("close unreferenced File:",get_basename(openCacheFile))
-                self.close_cachefile(openCacheFile)
-
-    def is_reference_existent(self, file):
-        existFlag = False
-        # inspect all refererres to the file object
-        gc.collect()  # clear garbage before collecting referrers
-        for ref in gc.get_referrers(file):
-            # does the file object have a referrer that has a 'h5f'
-            # attribute?
-            if isinstance(ref, dict) and 'h5f' in ref:
-                # file is still referred, must not be closed
-                existFlag = True
-                break
-        return existFlag
+        with self._lock:
+            self._apply_released_references()
+            for openCacheFile in list(self.get_open_cachefiles()):
+                if not self.openFileReferenceCount.get(get_basename(openCacheFile), 0):
+                    #                print("close unreferenced File:",get_basename(openCacheFile))
+                    self.close_cachefile(openCacheFile)
 
     def is_cachefile_existent(self, cacheFileName):
-        if cacheFileName in listdir(self.cache_dir):
-            return True
-        return False
+        return path.isfile(path.join(self.cache_dir, cacheFileName))
 
     def _increase_file_reference_counter(self, cacheFileName):
         self.openFileReferenceCount[cacheFileName] = self.openFileReferenceCount.get(cacheFileName, 0) + 1
 
-    def _decrease_file_reference_counter(self, cacheFileName):
-        self.openFileReferenceCount[cacheFileName] = self.openFileReferenceCount[cacheFileName] - 1
+    def _decrease_file_reference_counter(self, cacheFileName, fileRef=None):
+        if fileRef is not None and self.open_files.get(cacheFileName) is not fileRef():
+            return  # file was closed in the meantime, a file opened again under this name is not referenced
+        if cacheFileName in self.openFileReferenceCount:  # file may have been closed in the meantime
+            self.openFileReferenceCount[cacheFileName] = self.openFileReferenceCount[cacheFileName] - 1
 
-    def _print_open_files(self):
-        print(list(self.openFileReferenceCount.items()))
+    def _apply_released_references(self):
+        # must be called while holding the lock
+        while self._released:
+            self._decrease_file_reference_counter(*self._released.popleft())
 
-    def get_cache_file(self, obj, basename, mode='a'):
-        """Returns pytables .h5 file to h5f trait of calling object for caching."""
-        self._idle_if_busy()  #
-        self.busy = True
+    def _add_file_reference(self, obj, cacheFileName):
+        self._increase_file_reference_counter(cacheFileName)
+        # the reference is released as soon as obj is garbage collected
+        self._finalizers[obj] = finalize(obj, self._released.append, (cacheFileName, ref(obj.h5f)))
 
-        cacheFileName = basename + '_cache.h5'
-        objFileName = self.get_filename(obj.h5f)
+    def _remove_file_reference(self, obj, cacheFileName):
+        fin = self._finalizers.pop(obj, None)
+        if fin is not None:
+            fin()  # queues the release of the file the finalizer was registered for
+            self._apply_released_references()
+        else:
+            self._decrease_file_reference_counter(cacheFileName)
 
-        if objFileName:
-            if objFileName == cacheFileName:
-                self.busy = False
-                return
-            self._decrease_file_reference_counter(objFileName)
-
-        if cacheFileName not in self.open_files:  # or tables.file._open_files.filenames
-            if config.global_caching == 'readonly' and not self.is_cachefile_existent(
-                cacheFileName,
-            ):  # condition ensures that cachefile is not created in readonly mode
-                obj.h5f = None
-                self.busy = False
-                #                self._print_open_files()
-                return
+    def _print_open_files(self):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('open cache files: %s', list(self.openFileReferenceCount.items()))
+
+    def _get_or_open_cachefile(self, cacheFileName, mode):
+        """Returns the open cache file, opens it if necessary.
+
+        Only threads that access the same file are serialized while it is opened.
+        Returns None if the file does not exist in 'readonly' caching mode.
+        """
+        with self._lock:
+            fileLock = self._file_locks[cacheFileName]
+        with fileLock:
+            f = self.open_files.get(cacheFileName)
+            if f is not None:  # opened by another thread in the meantime
+                return f
             if config.global_caching == 'readonly':
+                if not self.is_cachefile_existent(cacheFileName):
+                    return None  # ensures that cachefile is not created in readonly mode
                 mode = 'r'
             f = self.open_cachefile(cacheFileName, mode)
-            self.open_files[cacheFileName] = f
-
-        obj.h5f = self.open_files[cacheFileName]
-        self._increase_file_reference_counter(cacheFileName)
+            with self._lock:
+                self.open_files[cacheFileName] = f
+            return f
 
-        # garbage collection
-        self.close_unreferenced_cachefiles()
-
-        self.busy = False
-        self._print_open_files()
+    def get_cache_file(self, obj, basename, mode='a'):
+        """Returns pytables .h5 file to h5f trait of calling object for caching."""
+        cacheFileName = basename + '_cache.h5'
+        objFileName = self.get_filename(obj.h5f)
+        if objFileName == cacheFileName:
+            return
+
+        while True:
+            # fast path without waiting for any lock if the file is already open
+            f = self.open_files.get(cacheFileName)
+            if f is None:
+                f = self._get_or_open_cachefile(cacheFileName, mode)
+            with self._lock:
+                self._apply_released_references()
+                if f is not None and self.open_files.get(cacheFileName) is not f:
+                    continue  # file was closed by another thread in the meantime
+                if objFileName:
+                    self._remove_file_reference(obj, objFileName)
+                obj.h5f = f
+                if f is None:
+                    return
+                self._add_file_reference(obj, cacheFileName)
+
+                # garbage collection
+                self.close_unreferenced_cachefiles()
+
+                self._print_open_files()
+                return
 
 
 H5cache = H5cache_class(config=config)
@@ -187,6 +187,14 @@ if config.have_h5py:
         compressionFilter = 'lzf'
         #        compressionFilter = 'blosc' # unavailable...
 
+        def __init__(self, name, mode='r', **kwargs):
+            # chunk cache settings from the global configuration, if any
+            if config.h5_rdcc_nbytes is not None:
+                kwargs.setdefault('rdcc_nbytes', config.h5_rdcc_nbytes)
+            if config.h5_rdcc_nslots is not None:
+                kwargs.setdefault('rdcc_nslots', config.h5_rdcc_nslots)
+            super().__init__(name, mode, **kwargs)
+
         def is_cached(self, nodename, group=None):
             if not group:
                 group = '/'
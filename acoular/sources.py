@@ -49,8 +49,8 @@ from numpy import (
     zeros,
 )
 from numpy import min as npmin
-from numpy.fft import fft, ifft
 from numpy.linalg import norm
+from scipy.fft import fft, ifft
 from scipy.special import sph_harm, spherical_jn, spherical_yn
 from traits.api import (
     Any,
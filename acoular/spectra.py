@@ -13,6 +13,7 @@
     PowerSpectraImport
 """
 
+from functools import lru_cache
 from warnings import warn
 
 from numpy import (
@@ -21,13 +22,15 @@ from numpy import (
     bartlett,
     blackman,
     dot,
+    dtype,
     empty,
-    fill_diagonal,
     hamming,
     hanning,
     imag,
     isscalar,
     linalg,
+    log2,
+    multiply,
     ndarray,
     newaxis,
     ones,
@@ -56,13 +59,22 @@ from traits.api import (
 
 from .calib import Calib
 from .configuration import config
-from .fastFuncs import calcCSM
+from .fastFuncs import calcCSMBatch, completeCSM
 from .h5cache import H5cache
 from .h5files import H5CacheFileBase
 from .internal import digest
 from .tprocess import SamplesGenerator, TimeInOut
 
 
+@lru_cache(maxsize=16)
+def _fftfreq(block_size, sample_freq):
+    # sample frequencies only depend on block size and sampling frequency,
+    # so they are computed once and shared between all callers
+    f = abs(fft.fftfreq(block_size, 1.0 / sample_freq)[: int(block_size / 2 + 1)])
+    f.setflags(write=False)
+    return f
+
+
 class BaseSpectra(HasPrivateTraits):
     #: Data source; :class:`~acoular.sources.SamplesGenerator` or derived object.
     source = Trait(SamplesGenerator)
@@ -109,6 +121,30 @@ class BaseSpectra(HasPrivateTraits):
     #: eigenvectors, corresponding to numpy dtypes. Default is 64 bit.
     precision = Trait('complex128', 'complex64', desc='precision of the fft')
 
+    #: Maximum number of FFT blocks that are transformed together in a single call,
+    #: defaults to 16. Transforming several blocks at once reduces the
+    #: overhead per FFT call, which dominates for small block sizes. The batch
+    #: is further limited by :attr:`fft_batch_bytes`. Note that a batch of
+    #: blocks is read from the source before the first spectrum is delivered,
+    #: which adds latency for live sources. Set to 1 for block-wise processing.
+    fft_batch = Int(16, desc='maximum number of FFT blocks transformed at once')
+
+    #: Memory budget in bytes for the time data of one batch of FFT blocks,
+    #: defaults to 2**24 (16 MiB). Large blocks or many channels are thus
+    #: transformed in smaller batches, down to a single block per call.
+    fft_batch_bytes = Int(1 << 24, desc='memory budget for a batch of FFT blocks')
+
+    #: Maximum number of threads used for the FFT, defaults to 1.
+    #: The transforms of the different blocks and channels are distributed
+    #: among the threads.
+    workers = Int(1, desc='number of threads used for the FFT')
+
+    #: Minimum amount of work per FFT call (block_size * log2(block_size)
+    #: times the number of transforms) that is needed to use more than one
+    #: thread, defaults to 2**18. For smaller transforms, the overhead of
+    #: starting the threads outweighs the gain.
+    min_work_for_threads = Int(1 << 18, desc='minimum FFT work for multithreading')
+
     # internal identifier
     digest = Property(depends_on=['precision', 'block_size', 'window', 'overlap'])
 
@@ -123,10 +159,11 @@ class BaseSpectra(HasPrivateTraits):
         -------
         f : ndarray
             Array of length *block_size/2+1* containing the sample frequencies.
+            The array is shared between calls and therefore read-only.
 
         """
         if self.source is not None:
-            return abs(fft.fftfreq(self.block_size, 1.0 / self.source.sample_freq)[: int(self.block_size / 2 + 1)])
+            return _fftfreq(self.block_size, self.source.sample_freq)
         return None
 
     # generator that yields the time data blocks for every channel (with optional overlap)
@@ -145,6 +182,47 @@ class BaseSpectra(HasPrivateTraits):
                 temp[0:bs] = temp[bs:]  # copy to left
                 pos -= bs
 
+    # generator that yields the spectra of the windowed time data blocks
+    def get_source_spectra(self, wind):
+        for spectra in self._get_source_spectra_batches(wind):
+            yield from spectra
+
+    # generator that yields the spectra of the windowed time data blocks in batches
+    def _get_source_spectra_batches(self, wind):
+        bs = self.block_size
+        # single precision input lets the FFT run directly in single precision
+        if self.precision == 'complex128':
+            precision = 'float64'
+        elif self.precision == 'complex64':
+            precision = 'float32'
+        # batch size limited by the memory budget
+        blockbytes = bs * self.numchannels * dtype(precision).itemsize
+        num = max(1, min(self.fft_batch, self.fft_batch_bytes // blockbytes))
+        # buffer is reused for all batches, windowing is done in-place
+        buf = empty((num, bs, self.numchannels), dtype=precision)
+        filled = 0
+        for data in self.get_source_data():
+            buf[filled] = data
+            filled += 1
+            if filled == num:
+                yield self._batch_fft(buf, wind)
+                filled = 0
+        if filled:
+            yield self._batch_fft(buf[:filled], wind)
+
+    def _fft_workers(self, num):
+        # use threads only if there is enough work for the given number of transforms
+        bs = self.block_size
+        if self.workers <= 1 or bs * log2(bs) * num < self.min_work_for_threads:
+            return 1
+        return min(self.workers, num)
+
+    def _batch_fft(self, buf, wind):
+        # transform the whole batch at once
+        multiply(buf, wind, out=buf)
+        workers = self._fft_workers(buf.shape[0] * buf.shape[2])
+        return fft.rfft(buf, None, 1, overwrite_x=True, workers=workers).astype(self.precision, copy=False)
+
 
 class FFTSpectra(BaseSpectra, TimeInOut):
     """Provides the spectra of multichannel time data.
@@ -177,9 +255,7 @@ class FFTSpectra(BaseSpectra, TimeInOut):
         """
         wind = self.window_(self.block_size)
         weight = sqrt(2) / self.block_size * sqrt(self.block_size / dot(wind, wind)) * wind[:, newaxis]
-        for data in self.get_source_data():
-            ft = fft.rfft(data * weight, None, 0).astype(self.precision)
-            yield ft
+        yield from self.get_source_spectra(weight)
 
 
 class PowerSpectra(BaseSpectra):
@@ -383,7 +459,7 @@ class PowerSpectra(BaseSpectra):
         wind = wind[newaxis, :].swapaxes(0, 1)
         numfreq = int(self.block_size / 2 + 1)
         csm_shape = (numfreq, t.numchannels, t.numchannels)
-        csmUpper = zeros(csm_shape, dtype=self.precision)
+        csm = zeros(csm_shape, dtype=self.precision)
         # print "num blocks", self.num_blocks
         # for backward compatibility
         if self.calib and self.calib.num_mics > 0:
@@ -391,30 +467,20 @@ class PowerSpectra(BaseSpectra):
                 wind = wind * self.calib.data[newaxis, :]
             else:
                 raise ValueError('Calibration data not compatible: %i, %i' % (self.calib.num_mics, t.numchannels))
-        # get time data blockwise
-        for data in self.get_source_data():
-            ft = fft.rfft(data * wind, None, 0).astype(self.precision)
-            calcCSM(csmUpper, ft)  # only upper triangular part of matrix is calculated (for speed reasons)
-        # create the full csm matrix via transposing and complex conj.
-        csmLower = csmUpper.conj().transpose(0, 2, 1)
-        [fill_diagonal(csmLower[cntFreq, :, :], 0) for cntFreq in range(csmLower.shape[0])]
-        csm = csmLower + csmUpper
         # onesided spectrum: multiplication by 2.0=sqrt(2)^2
-        return csm * (2.0 / self.block_size / weight / self.num_blocks)
+        # the normalization is applied to the window, this saves a pass over the whole csm
+        wind = wind * sqrt(2.0 / self.block_size / weight / self.num_blocks)
+        # get spectra in batches of blocks
+        for ft in self._get_source_spectra_batches(wind):
+            calcCSMBatch(csm, ft)  # only upper triangular part of matrix is calculated (for speed reasons)
+        # create the full csm matrix from the upper triangular part via complex conj.
+        completeCSM(csm)
+        return csm
 
     def calc_ev(self):
         """Eigenvalues / eigenvectors calculation."""
-        if self.precision == 'complex128':
-            eva_dtype = 'float64'
-        elif self.precision == 'complex64':
-            eva_dtype = 'float32'
-        #        csm = self.csm #trigger calculation
-        csm_shape = self.csm.shape
-        eva = empty(csm_shape[0:2], dtype=eva_dtype)
-        eve = empty(csm_shape, dtype=self.precision)
-        for i in range(csm_shape[0]):
-            (eva[i], eve[i]) = linalg.eigh(self.csm[i])
-        return (eva, eve)
+        # eigendecomposition of all frequencies at once, keeps the precision of the csm
+        return linalg.eigh(self.csm[:])
 
     def calc_eva(self):
         """Calculates eigenvalues of csm."""
@@ -467,11 +533,13 @@ class PowerSpectra(BaseSpectra):
             return func()
 
         nodename = traitname + '_' + self.digest
-        if config.global_caching == 'overwrite' and self.h5f.is_cached(nodename):
+        is_cached = self.h5f.is_cached(nodename)
+        if config.global_caching == 'overwrite' and is_cached:
             # print("remove existing node",nodename)
             self.h5f.remove_data(nodename)  # remove old data before writing in overwrite mode
+            is_cached = False
 
-        if not self.h5f.is_cached(nodename):
+        if not is_cached:
             if config.global_caching == 'readonly':
                 return func()
             #            print("create array, data not cached for",nodename)
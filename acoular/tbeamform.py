@@ -289,7 +289,10 @@ class BeamformerTime(TimeInOut):
                 if 'Sq' not in self.__class__.__name__:
                     yield Phi[:num]
                 elif self.r_diag:
-                    yield (Phi[:num] ** 2 - autopow[:num]).clip(min=0)
+                    # single output array, autopower removal and clipping in-place
+                    res = Phi[:num] ** 2
+                    res -= autopow[:num]
+                    yield res.clip(min=0, out=res)
                 else:
                     yield Phi[:num] ** 2
             else:
@@ -327,7 +330,9 @@ class BeamformerTime(TimeInOut):
                 if 'Sq' not in self.__class__.__name__:
                     yield Gamma[:num]
                 elif self.r_diag:
-                    yield Gamma[:num] ** 2 - (self.damp**2) * Gamma_autopow[:num]
+                    res = Gamma[:num] ** 2
+                    res -= (self.damp**2) * Gamma_autopow[:num]
+                    yield res
                 else:
                     yield Gamma[:num] ** 2
             self.bufferIndex += num
@@ -544,7 +549,10 @@ class BeamformerTimeTraj(BeamformerTime):
                 if 'Sq' not in self.__class__.__name__:
                     yield Phi[:num]
                 elif self.r_diag:
-                    yield (Phi[:num] ** 2 - autopow[:num]).clip(min=0)
+                    # single output array, autopower removal and clipping in-place
+                    res = Phi[:num] ** 2
+                    res -= autopow[:num]
+                    yield res.clip(min=0, out=res)
                 else:
                     yield Phi[:num] ** 2
             else:
@@ -596,7 +604,9 @@ class BeamformerTimeTraj(BeamformerTime):
                 if 'Sq' not in self.__class__.__name__:
                     yield Gamma[:num]
                 elif self.r_diag:
-                    yield Gamma[:num] ** 2 - (self.damp**2) * Gamma_autopow[:num]
+                    res = Gamma[:num] ** 2
+                    res -= (self.damp**2) * Gamma_autopow[:num]
+                    yield res
                 else:
                     yield Gamma[:num] ** 2
             self.bufferIndex += num
@@ -83,7 +83,7 @@ from numpy import (
 )
 from numpy.linalg import norm
 from numpy.matlib import repmat
-from scipy.fft import irfft, rfft
+from scipy.fft import irfft, next_fast_len, rfft
 from scipy.interpolate import CloughTocher2DInterpolator, CubicSpline, LinearNDInterpolator, Rbf, splev, splrep
 from scipy.signal import bilinear, butter, sosfilt, sosfiltfilt, tf2sos
 from scipy.spatial import Delaunay
@@ -2340,18 +2340,16 @@ class TimeConvolve(TimeInOut):
     def _get__kernel_blocks(self):
         [L, N] = self.kernel.shape
         num = self._block_size
+        nfft = next_fast_len(2 * num, True)
         P = int(ceil(L / num))
         trim = num * (P - 1)
-        blocks = zeros([P, num + 1, N], dtype='complex128')
+        blocks = zeros([P, nfft // 2 + 1, N], dtype='complex128')
 
         if P > 1:
             for i, block in enumerate(split(self.kernel[:trim], P - 1, axis=0)):
-                blocks[i] = rfft(concatenate([block, zeros([num, N])], axis=0), axis=0)
+                blocks[i] = rfft(block, nfft, axis=0)
 
-        blocks[-1] = rfft(
-            concatenate([self.kernel[trim:], zeros([2 * num - L + trim, N])], axis=0),
-            axis=0,
-        )
+        blocks[-1] = rfft(self.kernel[trim:], nfft, axis=0)
         return blocks
 
     def result(self, num=128):
@@ -2380,48 +2378,47 @@ class TimeConvolve(TimeInOut):
         Q = int(ceil(M / num))  # number of signal blocks
         R = int(ceil((L + M - 1) / num))  # number of output blocks
         last_size = (L + M - 1) % num  # size of final block
+        # FFT length of at least two blocks, padded to a fast length
+        nfft = next_fast_len(2 * num, True)
+        offset = nfft - num  # position of the newest block within the buffer
 
         idx = 0
-        FDL = zeros([P, num + 1, N], dtype='complex128')
-        buff = zeros([2 * num, N])  # time-domain input buffer
-        spec_sum = zeros([num + 1, N], dtype='complex128')
+        FDL = zeros([P, nfft // 2 + 1, N], dtype='complex128')
+        buff = zeros([nfft, N])  # time-domain input buffer
+        spec_sum = zeros([nfft // 2 + 1, N], dtype='complex128')
 
         signal_blocks = self.source.result(num)
         temp = next(signal_blocks)
-        buff[num : num + temp.shape[0]] = temp  # append new time-data
+        buff[offset : offset + temp.shape[0]] = temp  # append new time-data
 
         # for very short signals, we are already done
         if R == 1:
             _append_to_FDL(FDL, idx, P, rfft(buff, axis=0))
             spec_sum = _spectral_sum(spec_sum, FDL, self._kernel_blocks)
             # truncate s.t. total length is L+M-1 (like numpy convolve w/ mode="full")
-            yield irfft(spec_sum, axis=0)[num : last_size + num]
+            yield irfft(spec_sum, nfft, axis=0)[offset : last_size + offset]
             return
 
         # stream processing of source signal
         for temp in signal_blocks:
             _append_to_FDL(FDL, idx, P, rfft(buff, axis=0))
             spec_sum = _spectral_sum(spec_sum, FDL, self._kernel_blocks)
-            yield irfft(spec_sum, axis=0)[num:]
-            buff = concatenate(
-                [buff[num:], zeros([num, N])],
-                axis=0,
-            )  # shift input buffer to the left
-            buff[num : num + temp.shape[0]] = temp  # append new time-data
+            yield irfft(spec_sum, nfft, axis=0)[offset:]
+            buff[:offset] = buff[num:]  # shift input buffer to the left
+            buff[offset:] = 0
+            buff[offset : offset + temp.shape[0]] = temp  # append new time-data
 
         for _ in range(R - Q):
             _append_to_FDL(FDL, idx, P, rfft(buff, axis=0))
             spec_sum = _spectral_sum(spec_sum, FDL, self._kernel_blocks)
-            yield irfft(spec_sum, axis=0)[num:]
-            buff = concatenate(
-                [buff[num:], zeros([num, N])],
-                axis=0,
-            )  # shift input buffer to the left
+            yield irfft(spec_sum, nfft, axis=0)[offset:]
+            buff[:offset] = buff[num:]  # shift input buffer to the left
+            buff[offset:] = 0
 
         _append_to_FDL(FDL, idx, P, rfft(buff, axis=0))
         spec_sum = _spectral_sum(spec_sum, FDL, self._kernel_blocks)
         # truncate s.t. total length is L+M-1 (like numpy convolve w/ mode="full")
-        yield irfft(spec_sum, axis=0)[num : last_size + num]
+        yield irfft(spec_sum, nfft, axis=0)[offset : last_size + offset]
 
 
 @nb.jit(nopython=True, cache=True)
@@ -0,0 +1,44 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) Acoular Development Team.
+# ------------------------------------------------------------------------------
+"""Provides a temporary cache directory for test modules that write cache files.
+
+The cache files of a test module are written to a fresh directory of its own, so
+that no stale cache files from earlier runs are opened, the module can run in
+parallel with other test modules, and no cache files are left behind.
+"""
+
+import shutil
+import tempfile
+
+import acoular
+from acoular.h5cache import H5cache
+
+# configuration that is restored by teardown_cache_dir
+_saved_config = {}
+
+
+def close_cachefiles():
+    """Closes all open cache files."""
+    for cachefile in list(H5cache.get_open_cachefiles()):
+        H5cache.close_cachefile(cachefile)
+
+
+def setup_cache_dir():
+    """Switches to a fresh temporary cache directory and returns its path."""
+    for name in ('cache_dir', 'global_caching', 'h5library'):
+        _saved_config[name] = getattr(acoular.config, name)
+    cache_dir = tempfile.mkdtemp(prefix='acoular_cache_')
+    acoular.config.cache_dir = cache_dir
+    _saved_config['tmp_dir'] = cache_dir
+    return cache_dir
+
+
+def teardown_cache_dir():
+    """Closes all cache files, restores the configuration and removes the temporary cache directory."""
+    close_cachefiles()
+    cache_dir = _saved_config.pop('tmp_dir')
+    for name, value in _saved_config.items():
+        setattr(acoular.config, name, value)
+    _saved_config.clear()
+    shutil.rmtree(cache_dir, ignore_errors=True)
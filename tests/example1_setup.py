@@ -0,0 +1,49 @@
+# ------------------------------------------------------------------------------
+# Copyright (c) Acoular Development Team.
+# ------------------------------------------------------------------------------
+"""Provides the source case of example 1 that is shared by several test modules.
+
+The objects are created only once per test session, because Python imports
+this module only once. Thus the example data file is opened once, and the cross
+spectral matrix and its eigendecomposition are computed at most once for all
+test modules.
+"""
+
+from pathlib import Path
+
+from acoular import (
+    Calib,
+    Environment,
+    MaskedTimeSamples,
+    MicGeom,
+    PowerSpectra,
+    RectGrid,
+    SteeringVector,
+)
+
+# load exampledata
+testdir = Path(__file__).parent
+moduledir = testdir.parent
+datafile = moduledir / 'examples' / 'example_data.h5'
+calibfile = moduledir / 'examples' / 'example_calib.xml'
+micgeofile = moduledir / 'acoular' / 'xml' / 'array_56.xml'
+
+# values from example 1
+t1 = MaskedTimeSamples(name=datafile)
+t1.start = 0  # first sample, default
+t1.stop = 16000  # last valid sample = 15999
+invalid = [1, 7]  # list of invalid channels (unwanted microphones etc.)
+t1.invalid_channels = invalid
+t1.calib = Calib(from_file=calibfile)
+m = MicGeom(from_file=micgeofile)
+m.invalid_channels = invalid
+g = RectGrid(x_min=-0.6, x_max=-0.0, y_min=-0.3, y_max=0.3, z=0.68, increment=0.05)
+env = Environment(c=346.04)
+st = SteeringVector(grid=g, mics=m, env=env)
+f = PowerSpectra(
+    time_data=t1,
+    window='Hanning',
+    overlap='50%',
+    block_size=128,  # FFT-parameters
+    cached=False,
+)
@@ -4,6 +4,7 @@
 """Implements testing of frequency beamformers."""
 
 import unittest
+from functools import lru_cache
 from pathlib import Path
 
 # acoular imports
@@ -24,14 +25,10 @@ from acoular import (
     BeamformerMusic,
     BeamformerOrth,
     BeamformerSODIX,
-    Calib,
-    Environment,
-    MaskedTimeSamples,
-    MicGeom,
-    PowerSpectra,
-    RectGrid,
     SteeringVector,
 )
+from cache_setup import setup_cache_dir, teardown_cache_dir
+from example1_setup import env, f, g, m, st
 
 acoular.config.global_caching = 'none'  # to make sure that nothing is cached
 
@@ -51,40 +48,66 @@ WRITE_NEW_REFERENCE_DATA = False
 # Should always be False. Only set to True if it is necessary to
 # recalculate the data due to intended changes of the Beamformers.
 
-# load exampledata
 testdir = Path(__file__).parent
-moduledir = testdir.parent
-datafile = moduledir / 'examples' / 'example_data.h5'
-calibfile = moduledir / 'examples' / 'example_calib.xml'
-micgeofile = moduledir / 'acoular' / 'xml' / 'array_56.xml'
 
 # frequencies to test
 cfreqs = 1000, 8000
 
-# values from example 1
-t1 = MaskedTimeSamples(name=datafile)
-t1.start = 0  # first sample, default
-t1.stop = 16000  # last valid sample = 15999
-invalid = [1, 7]  # list of invalid channels (unwanted microphones etc.)
-t1.invalid_channels = invalid
-t1.calib = Calib(from_file=calibfile)
-m = MicGeom(from_file=micgeofile)
-m.invalid_channels = invalid
-g = RectGrid(x_min=-0.6, x_max=-0.0, y_min=-0.3, y_max=0.3, z=0.68, increment=0.05)
-env = Environment(c=346.04)
-st = SteeringVector(grid=g, mics=m, env=env)
-f = PowerSpectra(
-    time_data=t1,
-    window='Hanning',
-    overlap='50%',
-    block_size=128,  # FFT-parameters
-    cached=False,
-)
+
+def setUpModule():
+    setup_cache_dir()
+
+
+def tearDownModule():
+    teardown_cache_dir()
+
+
+@lru_cache(maxsize=None)
+def load_reference(name):
+    """Returns the reference data from file *name*, every file is only read once."""
+    ref_data = np.load(name)
+    ref_data.setflags(write=False)
+    return ref_data
+
+
+# preallocated work arrays of assert_close, keyed by shape and dtype of the compared data
+_work_arrays = {}
+
+
+def assert_close(actual, desired, rtol, atol):
+    """Does the same check as np.testing.assert_allclose, but without temporary arrays."""
+    if actual.shape == desired.shape:
+        key = (desired.shape, np.result_type(actual, desired))
+        if key not in _work_arrays:
+            _work_arrays[key] = (np.empty(desired.shape, key[1]), np.empty(desired.shape, np.finfo(key[1]).dtype))
+        diff, tol = _work_arrays[key]
+        np.subtract(actual, desired, out=diff)
+        np.abs(diff, out=diff)
+        np.abs(desired, out=tol)
+        tol *= rtol
+        tol += atol
+        if (diff.real <= tol).all():
+            return
+    # report the mismatch in detail
+    np.testing.assert_allclose(actual, desired, rtol=rtol, atol=atol)
+
+
+def synthetic_bands(b):
+    """Returns the octave band results of beamformer *b* for all tested frequencies as one array."""
+    bands = None
+    for i, cf in enumerate(cfreqs):
+        h = b.synthetic(cf, 1)
+        if bands is None:
+            bands = np.empty((len(cfreqs), *h.shape), dtype=np.float32)
+        bands[i] = h  # written directly into the output array, no intermediate list
+    return bands
 
 
 # produces a tuple of beamformer objects to test
 # because we need new objects for each test we have to call this more than once
 def fbeamformers():
+    # base beamformer of the deconvolution beamformers, separate from bbase so that it keeps
+    # cached=False when the caching tests set cached=True for all tested beamformers
     bb = BeamformerBase(freq_data=f, steer=st, r_diag=True, cached=False)
 
     # frequency beamformers to test
@@ -106,37 +129,65 @@ def fbeamformers():
     return (bbase, bc, beig, bm, bl, bo, bs, bd, bcmflassobic, bcmfnnls, bf, bdp, bgib, bgo, bsodix)
 
 
+# tested beamformer classes, in the order of fbeamformers()
+FBEAMFORMER_CLASSES = (
+    BeamformerBase,
+    BeamformerCapon,
+    BeamformerEig,
+    BeamformerMusic,
+    BeamformerClean,
+    BeamformerOrth,
+    BeamformerCleansc,
+    BeamformerDamas,
+    BeamformerCMFLassoLarsBIC,
+    BeamformerCMFNNLS,
+    BeamformerFunctional,
+    BeamformerDamasPlus,
+    BeamformerGIB,
+    BeamformerGridlessOrth,
+    BeamformerSODIX,
+)
+
+# reference data file of each tested beamformer class
+refdir = testdir / 'reference_data'
+REF_PATHS = {cls.__name__: refdir / f'{cls.__name__}.npy' for cls in FBEAMFORMER_CLASSES}
+
+
 class acoular_beamformer_test(unittest.TestCase):
+    def tearDown(self):
+        # the tests switch the global caching mode, the other tests expect that nothing is cached
+        acoular.config.global_caching = 'none'
+
     def test_beamformer_freq_results(self):
         # we expect the results to computed
         acoular.config.global_caching = 'none'
         for b in fbeamformers():
             with self.subTest(b.__class__.__name__ + ' global_caching = none'):
-                name = testdir / 'reference_data' / f'{b.__class__.__name__}.npy'
+                name = REF_PATHS[b.__class__.__name__]
                 # stack all frequency band results together
-                actual_data = np.array([b.synthetic(cf, 1) for cf in cfreqs], dtype=np.float32)
+                actual_data = synthetic_bands(b)
                 if WRITE_NEW_REFERENCE_DATA:
                     np.save(name, actual_data)
-                ref_data = np.load(name)
-                np.testing.assert_allclose(actual_data, ref_data, rtol=5e-5, atol=5e-8)
+                ref_data = load_reference(name)
+                assert_close(actual_data, ref_data, rtol=5e-5, atol=5e-8)
         # we expect the results to be computed and written to cache
         acoular.config.global_caching = 'individual'
         for b in fbeamformers():
             b.cached = True
             with self.subTest(b.__class__.__name__ + ' global_caching = individual'):
-                name = testdir / 'reference_data' / f'{b.__class__.__name__}.npy'
-                actual_data = np.array([b.synthetic(cf, 1) for cf in cfreqs], dtype=np.float32)
-                ref_data = np.load(name)
-                np.testing.assert_allclose(actual_data, ref_data, rtol=5e-5, atol=5e-8)
+                name = REF_PATHS[b.__class__.__name__]
+                actual_data = synthetic_bands(b)
+                ref_data = load_reference(name)
+                assert_close(actual_data, ref_data, rtol=5e-5, atol=5e-8)
         # we expect the results to be read from cache
         acoular.config.global_caching = 'all'
         for b in fbeamformers():
             b.cached = True
             with self.subTest(b.__class__.__name__ + ' global_caching = all'):
-                name = testdir / 'reference_data' / f'{b.__class__.__name__}.npy'
-                actual_data = np.array([b.synthetic(cf, 1) for cf in cfreqs], dtype=np.float32)
-                ref_data = np.load(name)
-                np.testing.assert_allclose(actual_data, ref_data, rtol=5e-5, atol=5e-8)
+                name = REF_PATHS[b.__class__.__name__]
+                actual_data = synthetic_bands(b)
+                ref_data = load_reference(name)
+                assert_close(actual_data, ref_data, rtol=5e-5, atol=5e-8)
         # we expect the cached results to be overwritten
         acoular.config.global_caching = 'overwrite'
         for b0, b1 in zip(fbeamformers(), fbeamformers()):
@@ -148,10 +199,10 @@ class acoular_beamformer_test(unittest.TestCase):
                     continue  # nor recalculated
                 b0.result[:] = 0
                 self.assertFalse(np.any(b0.result))
-                name = testdir / 'reference_data' / f'{b1.__class__.__name__}.npy'
-                actual_data = np.array([b1.synthetic(cf, 1) for cf in cfreqs], dtype=np.float32)
-                ref_data = np.load(name)
-                np.testing.assert_allclose(actual_data, ref_data, rtol=5e-5, atol=5e-8)
+                name = REF_PATHS[b1.__class__.__name__]
+                actual_data = synthetic_bands(b1)
+                ref_data = load_reference(name)
+                assert_close(actual_data, ref_data, rtol=5e-5, atol=5e-8)
 
     def test_beamformer_caching(self):
         # within each subcase, we need new beamformer objects because result is not updated when
@@ -183,23 +234,24 @@ class acoular_beamformer_test(unittest.TestCase):
 class Test_PowerSpectra(unittest.TestCase):
     def test_csm(self):
         """test that csm result has not changed over different releases"""
-        name = testdir / 'reference_data' / f'{f.__class__.__name__}_csm.npy'
-        # test only two frequencies
-        actual_data = np.array(f.csm[(16, 32), :, :], dtype=np.complex64)
+        name = refdir / f'{f.__class__.__name__}_csm.npy'
+        # test only two frequencies (16 and 32), the basic slice avoids a fancy indexing copy
+        # compared in the precision of the csm, the reference data is stored as complex64
+        actual_data = f.csm[16:33:16]
         if WRITE_NEW_REFERENCE_DATA:
-            np.save(name, actual_data)
-        ref_data = np.load(name)
-        np.testing.assert_allclose(actual_data, ref_data, rtol=1e-5, atol=1e-8)
+            np.save(name, actual_data.astype(np.complex64))
+        ref_data = load_reference(name)
+        assert_close(actual_data, ref_data, rtol=1e-5, atol=1e-8)
 
     def test_ev(self):
         """test that eve and eva result has not changed over different releases"""
-        name = testdir / 'reference_data' / f'{f.__class__.__name__}_ev.npy'
-        # test only two frequencies
-        actual_data = np.array((f.eve * f.eva[:, :, np.newaxis])[(16, 32), :, :], dtype=np.complex64)
+        name = refdir / f'{f.__class__.__name__}_ev.npy'
+        # test only two frequencies (16 and 32), sliced before the eigenvectors are weighted
+        actual_data = f.eve[16:33:16] * f.eva[16:33:16, :, np.newaxis]
         if WRITE_NEW_REFERENCE_DATA:
-            np.save(name, actual_data)
-        ref_data = np.load(name)
-        np.testing.assert_allclose(actual_data, ref_data, rtol=1e-5, atol=1e-8)
+            np.save(name, actual_data.astype(np.complex64))
+        ref_data = load_reference(name)
+        assert_close(actual_data, ref_data, rtol=1e-5, atol=1e-8)
 
 
 class TestSteerFormulation(unittest.TestCase):
@@ -214,12 +266,12 @@ class TestSteerFormulation(unittest.TestCase):
                 for dr in (True, False):
                     b.r_diag = dr
                     with self.subTest(f'{b.__class__.__name__} r_diag:{dr} steer:{kind}'):
-                        name = testdir / 'reference_data' / f'{b.__class__.__name__}{dr}{ki+1}.npy'
-                        actual_data = np.array([b.synthetic(cf, 1) for cf in cfreqs], dtype=np.float32)
+                        name = refdir / f'{b.__class__.__name__}{dr}{ki+1}.npy'
+                        actual_data = synthetic_bands(b)
                         if WRITE_NEW_REFERENCE_DATA:
                             np.save(name, actual_data)
-                        ref_data = np.load(name)
-                        np.testing.assert_allclose(actual_data, ref_data, rtol=1e-5, atol=1e-8)
+                        ref_data = load_reference(name)
+                        assert_close(actual_data, ref_data, rtol=1e-5, atol=1e-8)
 
 
 if __name__ == '__main__':
@@ -2,7 +2,6 @@ import unittest
 from pathlib import Path
 
 # acoular imports
-import tables
 from acoular import (
     BeamformerBase,
     BeamformerCapon,
@@ -16,63 +15,28 @@ from acoular import (
     BeamformerGIB,
     BeamformerMusic,
     BeamformerOrth,
-    Calib,
-    Environment,
-    MaskedTimeSamples,
-    MicGeom,
-    PowerSpectra,
-    RectGrid,
-    SteeringVector,
 )
+from acoular.h5files import _get_h5file_class
+from example1_setup import f, g, m, st
 
 testdir = Path(__file__).parent
-moduledir = testdir.parent
 
-# load numerical values from Examples
-h5file_num = tables.open_file(testdir / 'reference_data' / 'Example1_numerical_values_testsum.h5', 'r')
+# load numerical values from Examples with the h5 library configured for Acoular
+File = _get_h5file_class()
+with File(str(testdir / 'reference_data' / 'Example1_numerical_values_testsum.h5'), 'r') as h5file_num:
+    mpos_num = h5file_num.get_data_by_reference('mpos_values')[()]
+    grid_pos_num = h5file_num.get_data_by_reference('grid_pos_values')[()]
+    transfer_num = h5file_num.get_data_by_reference('transfer_values')[()]
+    csm_num = h5file_num.get_data_by_reference('csm_values')[()]
+    eve_num = h5file_num.get_data_by_reference('eva_values')[()]
+    eva_num = h5file_num.get_data_by_reference('eve_values')[()]
 
-mpos_num = h5file_num.get_node('/mpos_values').read()
-grid_pos_num = h5file_num.get_node('/grid_pos_values').read()
-transfer_num = h5file_num.get_node('/transfer_values').read()
-csm_num = h5file_num.get_node('/csm_values').read()
-eve_num = h5file_num.get_node('/eva_values').read()
-eva_num = h5file_num.get_node('/eve_values').read()
-
-d = {}
-for b in ('bb', 'bc', 'be', 'bm', 'bl', 'bo', 'bs', 'bd', 'bcmf', 'bf', 'bdp', 'bgib'):
-    d[b + 'num'] = h5file_num.get_node('/' + str(b) + '_values').read()
-
-
-# load exampledata
-datafile = moduledir / 'examples' / 'example_data.h5'
-calibfile = moduledir / 'examples' / 'example_calib.xml'
-micgeofile = moduledir / 'acoular' / 'xml' / 'array_56.xml'
+    d = {}
+    for b in ('bb', 'bc', 'be', 'bm', 'bl', 'bo', 'bs', 'bd', 'bcmf', 'bf', 'bdp', 'bgib'):
+        d[b + 'num'] = h5file_num.get_data_by_reference(str(b) + '_values')[()]
 
 # calc all values from example 1
 cfreq = 4000
-t1 = MaskedTimeSamples(name=datafile)
-t1.start = 0  # first sample, default
-t1.stop = 16000  # last valid sample = 15999
-invalid = [1, 7]  # list of invalid channels (unwanted microphones etc.)
-t1.invalid_channels = invalid
-t1.calib = Calib(from_file=calibfile)
-m = MicGeom(from_file=micgeofile)
-m.invalid_channels = invalid
-
-g = RectGrid(x_min=-0.6, x_max=-0.0, y_min=-0.3, y_max=0.3, z=0.68, increment=0.05)
-
-env = Environment(c=346.04)
-
-st = SteeringVector(grid=g, mics=m, env=env)
-
-f = PowerSpectra(
-    time_data=t1,
-    window='Hanning',
-    overlap='50%',
-    block_size=128,  # FFT-parameters
-    cached=False,
-)  # cached = False
-
 
 bb = BeamformerBase(freq_data=f, steer=st, r_diag=True, cached=False)
 bc = BeamformerCapon(freq_data=f, steer=st, cached=False)
@@ -1,5 +1,4 @@
 import unittest
-from copy import deepcopy
 
 import acoular as ac
 
@@ -15,7 +14,7 @@ class GridTest(unittest.TestCase):
             ac.PolySector(edges=[0.2, 0.2, -0.2, 0.2, -0.2, -0.2, 0.2, -0.2]),
             ac.ConvexSector(edges=[0.2, 0.2, -0.2, 0.2, -0.2, -0.2, 0.2, -0.2]),
         ]
-        multi_sector = ac.MultiSector(sectors=deepcopy(sectors))
+        multi_sector = ac.MultiSector(sectors=[sector.clone_traits() for sector in sectors])
         return sectors + [multi_sector]
 
     @staticmethod
@@ -53,7 +52,7 @@ class GridTest(unittest.TestCase):
                 default_nearest=False,
             ),
         ]
-        multi_sector = ac.MultiSector(sectors=deepcopy(sectors))
+        multi_sector = ac.MultiSector(sectors=[sector.clone_traits() for sector in sectors])
         return sectors + [multi_sector]
 
     @staticmethod
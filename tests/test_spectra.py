@@ -22,13 +22,16 @@ class Test_PowerSpectra(unittest.TestCase):
         test_csm_sum = np.abs(np.imag(ps.csm)).sum() + np.real(ps.csm).sum()
         self.assertAlmostEqual(test_csm_sum, csm_sum)
 
+    def test_fft_batch_budget(self):
+        """test that the csm does not depend on the number of blocks transformed at once."""
+        ps1 = acoular.PowerSpectra(source=p, block_size=128, window='Hanning', cached=False, fft_batch_bytes=1)
+        np.testing.assert_allclose(ps1.csm, ps.csm, rtol=1e-12, atol=1e-15)
+
 
 class Test_FFTSpectra(unittest.TestCase):
     def test_calc_fft(self):
         """test that fft result has not changed over different releases."""
-        test_fft_sum = 0
-        for temp in fft.result():
-            test_fft_sum += temp.sum()
+        test_fft_sum = np.sum([temp.sum() for temp in fft.result()])
         self.assertAlmostEqual(test_fft_sum, fft_sum)
 
 
@@ -1,9 +1,11 @@
 import unittest
+from itertools import islice, product
 from os import path
 
 import acoular as ac
 import numpy as np
 from acoular import __file__ as bpath
+from cache_setup import close_cachefiles, setup_cache_dir, teardown_cache_dir
 
 # load some array geometry
 micgeofile = path.join(path.split(bpath)[0], 'xml', 'array_64.xml')
@@ -12,25 +14,91 @@ micgeom = ac.MicGeom(from_file=micgeofile)
 num_samples = 7
 block_size = 5
 
+# the signal is shared by all tests, only the sources and caches are created anew
+sig = ac.WNoiseGenerator(numsamples=num_samples)
+
+
+def setUpModule():
+    global cache_dir
+    cache_dir = setup_cache_dir()
+
+
+def tearDownModule():
+    teardown_cache_dir()
+
 
 class TimeCacheTest(unittest.TestCase):
     global_caching_configs = ['individual', 'all', 'none', 'readonly', 'overwrite']
+    h5libraries = [lib for lib in ('tables', 'h5py') if getattr(ac.config, f'have_{lib}')]
+
+    @staticmethod
+    def use_h5library(lib):
+        """Switches to h5 library *lib*, which gets a cache directory of its own."""
+        close_cachefiles()
+        ac.config.h5library = lib
+        ac.config.cache_dir = path.join(cache_dir, lib)
+
+    def assert_cached_block_equal(self, block_c, block_nc):
+        """Asserts that a block from TimeCache is bit-exact to the source block.
+
+        TimeCache stores float32 data, so both blocks are compared at this precision.
+        """
+        self.assertTrue(np.array_equal(block_c.astype(np.float32, copy=False), block_nc.astype(np.float32, copy=False)))
 
     def test_valid_cache_result(self):
         """manually create an incomplete cash file and then read it."""
-        for conf in self.global_caching_configs:
+        for lib, conf in product(self.h5libraries, self.global_caching_configs):
+            if lib != ac.config.h5library:
+                self.use_h5library(lib)
             ac.config.global_caching = conf
-            with self.subTest(conf):
-                sig = ac.WNoiseGenerator(numsamples=num_samples)
+            with self.subTest(f'{lib} {conf}'):
                 ps = ac.PointSource(signal=sig, mics=micgeom)
                 tc = ac.TimeCache(source=ps)
-                for i, (block_c, block_nc) in enumerate(zip(tc.result(block_size), ps.result(block_size))):
-                    np.testing.assert_array_almost_equal(block_c, block_nc)
-                    if i == 0:
-                        break
+                # only the first block is processed, which leaves an incomplete cache file
+                result_c = tc.result(block_size)
+                for block_c, block_nc in islice(zip(result_c, ps.result(block_size)), 1):
+                    self.assert_cached_block_equal(block_c, block_nc)
+                result_c.close()
 
                 for block_c, block_nc in zip(tc.result(block_size), ps.result(block_size)):
-                    np.testing.assert_array_almost_equal(block_c, block_nc)
+                    self.assert_cached_block_equal(block_c, block_nc)
+
+    @unittest.skipUnless(ac.config.have_h5py, 'requires h5py')
+    def test_h5py_chunk_cache(self):
+        """test that cache files opened with h5py use the configured chunk cache."""
+        self.use_h5library('h5py')
+        ac.config.global_caching = 'individual'
+        ac.config.h5_rdcc_nbytes = 4 * 1024 * 1024
+        ac.config.h5_rdcc_nslots = 10007
+        try:
+            sig1 = ac.WNoiseGenerator(seed=1, numsamples=num_samples)  # cache file not used by other tests
+            tc = ac.TimeCache(source=ac.PointSource(signal=sig1, mics=micgeom))
+            next(tc.result(block_size))
+            nslots, nbytes = tc.h5f.id.get_access_plist().get_cache()[1:3]
+            self.assertEqual((nslots, nbytes), (10007, 4 * 1024 * 1024))
+        finally:
+            ac.config.h5_rdcc_nbytes = None
+            ac.config.h5_rdcc_nslots = None
+
+    def test_readonly_shared_file(self):
+        """test that readers of an existing cache file share one read-only file handle."""
+        sig2 = ac.WNoiseGenerator(seed=2, numsamples=num_samples)  # cache file not used by other tests
+        ps = ac.PointSource(signal=sig2, mics=micgeom)
+        for lib in self.h5libraries:
+            with self.subTest(lib):
+                self.use_h5library(lib)
+                ac.config.global_caching = 'individual'
+                for _ in ac.TimeCache(source=ps).result(block_size):  # write complete cache file
+                    pass
+                self.use_h5library(lib)  # close the file opened for writing
+                ac.config.global_caching = 'readonly'
+                tc1, tc2 = ac.TimeCache(source=ps), ac.TimeCache(source=ps)
+                gen1, gen2, gen_nc = tc1.result(block_size), tc2.result(block_size), ps.result(block_size)
+                for block_c1, block_c2, block_nc in zip(gen1, gen2, gen_nc):
+                    self.assert_cached_block_equal(block_c1, block_nc)
+                    self.assert_cached_block_equal(block_c2, block_nc)
+                self.assertIs(tc1.h5f, tc2.h5f)
+                self.assertEqual(tc1.h5f.mode, 'r')
 
 
 if __name__ == '__main__':
@@ -68,6 +68,24 @@ class TprocessTest(unittest.TestCase):
             REF = np.convolve(np.squeeze(KERNEL), np.squeeze(SIG[:, i]))
             np.testing.assert_allclose(np.squeeze(RES[:, i]), REF, rtol=1e-5, atol=1e-8)
 
+    def test_timeconvolve_padded_fft(self):
+        """compare results of timeconvolve with numpy convolve for a block size with padded FFT length"""
+        # next_fast_len(2 * 127) = 256 > 254, the FFT length is larger than two blocks
+        NUM = 127
+        NSAMPLES = 1000
+        N1 = WNoiseGenerator(sample_freq=1000, numsamples=NSAMPLES, seed=1)
+        MGEOM = MicGeom(mpos_tot=[[1, 2], [1, 1], [1, 1]])
+        P1 = PointSource(signal=N1, mics=MGEOM)
+        KERNEL = np.random.default_rng(1).random((100, 2))
+        CONV = TimeConvolve(kernel=KERNEL, source=P1)
+
+        SIG = tools.return_result(P1, num=NUM)
+        RES = tools.return_result(CONV, num=NUM)
+
+        for i in range(P1.numchannels):
+            REF = np.convolve(KERNEL[:, i], SIG[:, i])
+            np.testing.assert_allclose(RES[:, i], REF, rtol=1e-5, atol=1e-8)
+
     # @unittest.skip
     def test_tprocess_results(self):
         """compare results with reference results"""